@@ -0,0 +1,6 @@
+import sys
+from src.cli import main
+
+# Atalho mantido por compatibilidade: equivale a `python run.py rebuild`
+if __name__ == "__main__":
+    main(['rebuild'] + sys.argv[1:])
@@ -0,0 +1,198 @@
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import logging
+import os
+import sys
+from src.utils.helpers import setup_logging
+
+# Ponto de entrada único (`python run.py <comando>`): cada subcomando importa as
+# dependências pesadas (Selenium, pandas, openpyxl) só quando é executado.
+
+
+def _select_jobs(target: Optional[str]) -> list:
+    """Alvos do targets.json (ou só o informado em --target)."""
+    from src.core.targets import find_job, load_jobs
+    return [find_job(target)] if target else load_jobs()
+
+
+def cmd_scrape(args: argparse.Namespace) -> None:
+    """Raspa todos os alvos com o pool de workers."""
+    from dataclasses import asdict
+    from src.core.jobs import JobQueue
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    jobs: list = _select_jobs(args.target)
+    job_queue: JobQueue = JobQueue(jobs, args.workers)
+    results: Dict[str, Any] = job_queue.run()
+    for target, report in results.items():
+        logger.info(
+            f"{target}: {report.cards} cartas em {report.decks} decks, "
+            f"{report.elapsed_seconds}s, pico de memória {report.peak_memory_mb} MB"
+        )
+
+    # Relatório da execução
+    os.makedirs("output", exist_ok=True)
+    with open(os.path.join("output", "run_report.json"), 'w', encoding='utf-8') as f:
+        json.dump([asdict(report) for report in results.values()], f, ensure_ascii=False, indent=4)
+
+    # Relatório do que mudou desde a extração anterior
+    from src.core.diff import write_diff_report
+    for job in jobs:
+        if job.name in results:
+            write_diff_report(job)
+
+    # Como o script original, termina com erro se algum alvo falhou
+    if job_queue.failed:
+        raise RuntimeError(f"Scraping failed for targets: {', '.join(job_queue.failed)}")
+
+
+def cmd_diff(args: argparse.Namespace) -> None:
+    """Compara os dois últimos snapshots de cada alvo."""
+    from src.core.diff import write_diff_report
+
+    for job in _select_jobs(args.target):
+        report = write_diff_report(job, excel=not args.no_excel)
+        if report is not None and args.print:
+            print(json.dumps(report, ensure_ascii=False, indent=4))
+
+
+def cmd_update(args: argparse.Namespace) -> None:
+    """Atualiza o Excel de cada alvo com o último JSON extraído."""
+    from src.core.excel_handler import ExcelHandler
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    for job in _select_jobs(args.target):
+        handler: ExcelHandler = ExcelHandler(job.excel_file)
+        data: dict = handler.read_json_file(os.path.join("output", job.json_filename))
+        excel_path: str = handler.update_excel(data)
+        logger.info(f"Excel file updated successfully at: {excel_path}")
+
+
+def cmd_rebuild(args: argparse.Namespace) -> None:
+    """Reconstrói o Excel de cada alvo a partir do histórico."""
+    from src.core.excel_handler import ExcelHandler
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    for job in _select_jobs(args.target):
+        handler: ExcelHandler = ExcelHandler(job.excel_file)
+        excel_path: str = handler.rebuild_excel(job.history_dir)
+        logger.info(f"Excel file rebuilt successfully at: {excel_path}")
+
+
+def cmd_query(args: argparse.Namespace) -> None:
+    """Consulta o histórico indexado (ou sobe a API local)."""
+    from src.core.history import HistoryStore
+    from src.core.targets import DEFAULT_NAME
+
+    target: str = args.target or DEFAULT_NAME
+    store: HistoryStore = HistoryStore()
+    store.sync()
+
+    if args.query == 'serve':
+        from src.core.api import serve
+        serve(store, args.host, args.port)
+        return
+
+    if args.query == 'price':
+        result: Any = store.price_history(args.card, target)
+    elif args.query == 'movers':
+        result = store.top_movers(args.since, target, args.limit)
+    else:
+        result = store.pool_value(args.date, target)
+
+    print(json.dumps(result, ensure_ascii=False, indent=4))
+
+
+def cmd_status(args: argparse.Namespace) -> None:
+    """Mostra os alvos configurados e o último snapshot de cada um."""
+    import glob
+    from src.core.targets import get_account_cookies_file
+
+    status: List[Dict[str, Any]] = []
+    for job in _select_jobs(args.target):
+        snapshots: List[str] = sorted(glob.glob(os.path.join(job.history_dir, '*.json')))
+        status.append({
+            'target': job.name,
+            'url': job.url,
+            'account': job.account,
+            'deck_prefix': job.deck_prefix,
+            'snapshots': len(snapshots),
+            'last_snapshot': os.path.basename(snapshots[-1]) if snapshots else None,
+            'saved_session': os.path.exists(get_account_cookies_file(job.account)),
+            'excel_file': job.excel_file if os.path.exists(job.excel_file) else None,
+        })
+
+    print(json.dumps(status, ensure_ascii=False, indent=4))
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    """Mede o tempo de inicialização e de rebuild/consultas com dados sintéticos."""
+    from src.utils.bench import run_benchmarks
+    run_benchmarks(args.cards, args.days, args.output)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser com todos os subcomandos."""
+    parser = argparse.ArgumentParser(prog='run.py', description="LigaMagic Price Tracker")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    # Opção comum a todos os subcomandos
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--target', help="Nome do alvo no targets.json (padrão: todos)")
+
+    scrape = subparsers.add_parser('scrape', parents=[common], help="Raspa os preços no LigaMagic")
+    scrape.add_argument('--workers', type=int, default=None, help="Navegadores em paralelo")
+    scrape.set_defaults(func=cmd_scrape)
+
+    diff = subparsers.add_parser('diff', parents=[common], help="Compara os dois últimos snapshots")
+    diff.add_argument('--no-excel', action='store_true', help="Salva só o JSON")
+    diff.add_argument('--print', action='store_true', help="Mostra o relatório no terminal")
+    diff.set_defaults(func=cmd_diff)
+
+    update = subparsers.add_parser('update', parents=[common], help="Atualiza o Excel com o último JSON")
+    update.set_defaults(func=cmd_update)
+
+    rebuild = subparsers.add_parser('rebuild', parents=[common], help="Reconstrói o Excel a partir do histórico")
+    rebuild.set_defaults(func=cmd_rebuild)
+
+    query = subparsers.add_parser('query', parents=[common], help="Consulta o histórico de preços")
+    queries = query.add_subparsers(dest='query', required=True)
+    price = queries.add_parser('price', help="Preço de uma carta ao longo do tempo")
+    price.add_argument('card')
+    movers = queries.add_parser('movers', help="Maiores variações desde uma data")
+    movers.add_argument('--since', required=True, help="dd/mm/aaaa ou aaaa-mm-dd")
+    movers.add_argument('--limit', type=int, default=20)
+    value = queries.add_parser('value', help="Valor do pool em uma data")
+    value.add_argument('--date', required=True, help="dd/mm/aaaa ou aaaa-mm-dd")
+    serve = queries.add_parser('serve', help="Sobe a API HTTP/JSON local")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    query.set_defaults(func=cmd_query)
+
+    status = subparsers.add_parser('status', parents=[common], help="Mostra alvos e últimos snapshots")
+    status.set_defaults(func=cmd_status)
+
+    bench = subparsers.add_parser('bench', help="Mede inicialização, rebuild e consultas")
+    bench.add_argument('--cards', type=int, default=500, help="Cartas por snapshot sintético")
+    bench.add_argument('--days', type=int, default=365, help="Quantidade de snapshots sintéticos")
+    bench.add_argument('--output', default=None, help="Arquivo para salvar o resultado")
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Executa o subcomando informado."""
+    args: argparse.Namespace = build_parser().parse_args(argv)
+    logger: logging.Logger = setup_logging()
+
+    try:
+        args.func(args)
+    except Exception as e:
+        logger.error(f"Error during {args.command}: {str(e)}")
+        raise
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -13,15 +13,59 @@ LOGS_DIR = os.path.join(BASE_DIR, 'logs')
 
 # Configurações do Selenium
 SELENIUM_DRIVER_PATH = os.getenv('SELENIUM_DRIVER_PATH', '')
-SELENIUM_HEADLESS = os.getenv('SELENIUM_HEADLESS', 'False').lower() == 'true'
+SELENIUM_HEADLESS = os.getenv('SELENIUM_HEADLESS', 'True').lower() == 'true'
+
+# Perfil enxuto: diretório próprio, carregamento "eager" e bloqueio de recursos pesados
+SELENIUM_LEAN_PROFILE = os.getenv('SELENIUM_LEAN_PROFILE', 'True').lower() == 'true'
+SELENIUM_PROFILE_DIR = os.getenv('SELENIUM_PROFILE_DIR', os.path.join(BASE_DIR, '.chrome-profile'))
+SELENIUM_BLOCKED_URLS = [
+    pattern.strip()
+    for pattern in os.getenv(
+        'SELENIUM_BLOCKED_URLS',
+        '*.png,*.jpg,*.jpeg,*.gif,*.webp,*.svg,*.ico,*.css,*.woff,*.woff2,*.ttf,*.otf,'
+        '*.mp4,*.webm,'
+        '*doubleclick.net*,*googlesyndication.com*,*googletagmanager.com*,*google-analytics.com*,'
+        '*googleadservices.com*,*adservice.google.*,*facebook.net*,*facebook.com/tr*,'
+        '*hotjar.com*,*clarity.ms*,*criteo.*,*taboola.com*,*outbrain.com*'
+    ).split(',')
+    if pattern.strip()
+]
+
+# Ritmo das requisições ao site (token bucket adaptativo, em requisições por segundo)
+GOVERNOR_RATE = float(os.getenv('GOVERNOR_RATE', '1.0'))
+GOVERNOR_MIN_RATE = float(os.getenv('GOVERNOR_MIN_RATE', '0.2'))
+GOVERNOR_MAX_RATE = float(os.getenv('GOVERNOR_MAX_RATE', '4.0'))
+GOVERNOR_BURST = float(os.getenv('GOVERNOR_BURST', '2'))
+GOVERNOR_SLOW_SECONDS = float(os.getenv('GOVERNOR_SLOW_SECONDS', '8'))
+GOVERNOR_MAX_RETRIES = int(os.getenv('GOVERNOR_MAX_RETRIES', '3'))
+GOVERNOR_BACKOFF_SECONDS = float(os.getenv('GOVERNOR_BACKOFF_SECONDS', '2'))
+
+# Extração em lotes e gravação incremental do snapshot
+EXTRACT_BATCH_SIZE = int(os.getenv('EXTRACT_BATCH_SIZE', '500'))
+SNAPSHOT_FLUSH_EVERY = int(os.getenv('SNAPSHOT_FLUSH_EVERY', '1000'))
 
 # Configurações do Excel
 EXCEL_OUTPUT_FILENAME = os.getenv('EXCEL_OUTPUT_FILENAME', 'output.xlsx')
 
+# Histórico de extrações (um JSON por execução)
+HISTORY_DIR = os.getenv('HISTORY_DIR', os.path.join('output', 'history'))
+# Índice SQLite do histórico usado pelas consultas de preço
+HISTORY_DB = os.getenv('HISTORY_DB', os.path.join('output', 'history.db'))
+QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', '256'))
+
 # Configurações de Logging
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_FILE = os.path.join(LOGS_DIR, 'rpa.log')
 
 # URLs e outros parâmetros específicos do scraping
-TARGET_URL = os.getenv('TARGET_URL', '') 
\ No newline at end of file
+TARGET_URL = os.getenv('TARGET_URL', '')
+# Vários alvos (URL, conta e prefixo dos decks) podem ser listados em um JSON
+TARGETS_FILE = os.getenv('TARGETS_FILE', 'targets.json')
+SCRAPER_WORKERS = int(os.getenv('SCRAPER_WORKERS', '2'))
+BASE_URL = os.getenv('BASE_URL', 'https://www.ligamagic.com.br')
+
+# Credenciais e sessão do LigaMagic
+LIGAMAGIC_EMAIL = os.getenv('LIGAMAGIC_EMAIL', '')
+LIGAMAGIC_PASSWORD = os.getenv('LIGAMAGIC_PASSWORD', '')
+COOKIES_FILE = os.getenv('COOKIES_FILE', os.path.join('output', 'session_cookies.json')) 
\ No newline at end of file
@@ -0,0 +1,79 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict
+from urllib.parse import parse_qs, urlparse
+import json
+import logging
+import time
+from src.config.settings import HISTORY_DIR
+from src.core.history import HistoryStore
+from src.core.targets import DEFAULT_NAME
+
+# Intervalo mínimo (s) entre duas sincronizações com o histórico
+SYNC_INTERVAL: float = 5.0
+
+
+def _make_handler(store: HistoryStore, history_dir: str) -> type:
+    """Cria o handler HTTP ligado ao HistoryStore informado."""
+    logger: logging.Logger = logging.getLogger(__name__)
+    last_sync: Dict[str, float] = {'at': time.monotonic()}
+
+    def sync() -> None:
+        # Indexa snapshots gravados depois da subida da API; sync() limpa o cache quando há novidades
+        if time.monotonic() - last_sync['at'] < SYNC_INTERVAL:
+            return
+        last_sync['at'] = time.monotonic()
+        try:
+            store.sync(history_dir)
+        except Exception as e:
+            logger.warning(f"Error syncing history: {str(e)}")
+
+    routes: Dict[str, Callable[[Dict[str, str]], Any]] = {
+        '/price': lambda q: store.price_history(q['card'], q.get('target', DEFAULT_NAME)),
+        '/movers': lambda q: store.top_movers(
+            q['since'], q.get('target', DEFAULT_NAME), int(q.get('limit', 20))
+        ),
+        '/value': lambda q: store.pool_value(q['date'], q.get('target', DEFAULT_NAME)),
+    }
+
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            query: Dict[str, str] = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            route = routes.get(url.path)
+
+            if route is None:
+                self._send(404, {'error': f"Unknown endpoint: {url.path}", 'endpoints': sorted(routes)})
+                return
+            sync()
+            try:
+                self._send(200, route(query))
+            except KeyError as e:
+                self._send(400, {'error': f"Missing parameter: {e.args[0]}"})
+            except ValueError as e:
+                self._send(400, {'error': str(e)})
+
+        def _send(self, status: int, payload: Any) -> None:
+            body: bytes = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logging.getLogger(__name__).debug(format % args)
+
+    return QueryHandler
+
+
+def serve(store: HistoryStore, host: str = '127.0.0.1', port: int = 8765, history_dir: str = HISTORY_DIR) -> None:
+    """Sobe a API local de consulta de preços (GET /price, /movers, /value), sempre sincronizada com o histórico."""
+    logger: logging.Logger = logging.getLogger(__name__)
+    server: HTTPServer = HTTPServer((host, port), _make_handler(store, history_dir))
+    logger.info(f"Price query API listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,137 @@
+from typing import Any, Dict, List, Optional, Tuple
+import glob
+import json
+import logging
+import os
+from src.core.history import parse_price, parse_quantity
+from src.core.targets import ScrapeJob
+
+# Ordem e rótulos das seções na planilha
+SECTIONS: Dict[str, str] = {
+    'price_changes': 'Preço',
+    'quantity_changes': 'Quantidade',
+    'added': 'Nova',
+    'removed': 'Removida',
+}
+COLUMNS: List[str] = ['card', 'old_quantity', 'quantity', 'old_price', 'price', 'delta', 'delta_pct', 'impact']
+
+
+def _index_cards(snapshot: Dict[str, Any]) -> Dict[str, Tuple[Optional[int], Optional[float]]]:
+    """Tabela hash nome -> (quantidade, preço); a última ocorrência prevalece, como na planilha."""
+    return {
+        card['name']: (parse_quantity(card['quantity']), parse_price(card['price']))
+        for card in snapshot['cards']
+    }
+
+
+def _entry(name: str, old: Tuple[Optional[int], Optional[float]],
+           new: Tuple[Optional[int], Optional[float]], impact: float) -> Dict[str, Any]:
+    """Linha do relatório com o antes/depois da carta."""
+    (old_quantity, old_price), (quantity, price) = old, new
+    delta: Optional[float] = None
+    if price is not None and old_price is not None:
+        delta = round(price - old_price, 2)
+    return {
+        'card': name,
+        'old_quantity': old_quantity,
+        'quantity': quantity,
+        'old_price': old_price,
+        'price': price,
+        'delta': delta,
+        'delta_pct': round(delta / old_price * 100, 2) if delta is not None and old_price else None,
+        'impact': round(impact, 2),
+    }
+
+
+def diff_snapshots(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Compara dois snapshots em tempo linear (hash join pelo nome da carta)."""
+    old_cards = _index_cards(previous)
+    new_cards = _index_cards(current)
+    missing: Tuple[None, None] = (None, None)
+
+    added: List[Dict[str, Any]] = []
+    quantity_changes: List[Dict[str, Any]] = []
+    price_changes: List[Dict[str, Any]] = []
+
+    for name, (quantity, price) in new_cards.items():
+        old = old_cards.get(name)
+        if old is None:
+            added.append(_entry(name, missing, (quantity, price), (quantity or 0) * (price or 0)))
+            continue
+
+        old_quantity, old_price = old
+        if quantity != old_quantity:
+            impact: float = ((quantity or 0) - (old_quantity or 0)) * (price or 0)
+            quantity_changes.append(_entry(name, old, (quantity, price), impact))
+        if price is not None and old_price is not None and price != old_price:
+            price_changes.append(_entry(name, old, (quantity, price), (quantity or 0) * (price - old_price)))
+
+    removed: List[Dict[str, Any]] = [
+        _entry(name, (quantity, price), missing, -(quantity or 0) * (price or 0))
+        for name, (quantity, price) in old_cards.items()
+        if name not in new_cards
+    ]
+
+    report: Dict[str, Any] = {
+        'from': previous['extraction_date'],
+        'to': current['extraction_date'],
+        'added': added,
+        'removed': removed,
+        'quantity_changes': quantity_changes,
+        'price_changes': price_changes,
+    }
+    # Maior impacto (valor em reais) primeiro
+    for section in SECTIONS:
+        report[section].sort(key=lambda item: abs(item['impact']), reverse=True)
+    return report
+
+
+def latest_snapshots(history_dir: str) -> Optional[Tuple[str, str]]:
+    """Caminhos do penúltimo e do último snapshot (os nomes já são ordenados por data)."""
+    snapshots: List[str] = sorted(glob.glob(os.path.join(history_dir, '*.json')))
+    if len(snapshots) < 2:
+        return None
+    return snapshots[-2], snapshots[-1]
+
+
+def write_diff_sheet(report: Dict[str, Any], excel_file: str) -> None:
+    """Grava o relatório em uma planilha única, em modo streaming."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Variações')
+    ws.append(['Tipo', 'Nome da Carta', 'Qtd. Anterior', 'Quantidade',
+               'Preço Anterior', 'Preço', 'Variação', 'Variação %', 'Impacto'])
+    for section, label in SECTIONS.items():
+        for item in report[section]:
+            ws.append([label] + [item[column] for column in COLUMNS])
+    wb.save(excel_file)
+
+
+def write_diff_report(job: ScrapeJob, excel: bool = True) -> Optional[Dict[str, Any]]:
+    """Compara os dois últimos snapshots do alvo e salva o relatório em JSON (e planilha)."""
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    paths = latest_snapshots(job.history_dir)
+    if paths is None:
+        logger.info(f"Not enough snapshots to diff target {job.name}")
+        return None
+
+    snapshots: List[Dict[str, Any]] = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshots.append(json.load(f))
+    report: Dict[str, Any] = diff_snapshots(*snapshots)
+
+    os.makedirs(os.path.dirname(job.diff_json), exist_ok=True)
+    with open(job.diff_json, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
+    if excel:
+        write_diff_sheet(report, job.diff_excel)
+
+    logger.info(
+        f"Diff {report['from']} -> {report['to']} ({job.name}): "
+        f"{len(report['added'])} added, {len(report['removed'])} removed, "
+        f"{len(report['quantity_changes'])} quantity changes, {len(report['price_changes'])} price changes"
+    )
+    return report
@@ -1,18 +1,24 @@
 import pandas as pd
+import numpy as np
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 import json
 import os
-from datetime import datetime
+import glob
+import shutil
+from copy import copy
+from datetime import date, datetime
 from openpyxl.styles import PatternFill, Alignment
-from openpyxl import load_workbook
+from openpyxl import load_workbook, Workbook
+from openpyxl.cell import WriteOnlyCell
+from src.config.settings import HISTORY_DIR
 
 class ExcelHandler:
     """Classe responsável por manipular arquivos Excel."""
     
-    def __init__(self) -> None:
+    def __init__(self, excel_file: str = "output/pool.xlsx") -> None:
         self.logger: logging.Logger = logging.getLogger(__name__)
-        self.excel_file: str = "output/pool.xlsx"
+        self.excel_file: str = excel_file
         self.date_format: str = "%d/%m/%Y"
         self.green_fill = PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid')
         self.red_fill = PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid')
@@ -287,4 +293,189 @@ class ExcelHandler:
             
         except Exception as e:
             self.logger.error(f"Error applying alignment: {str(e)}")
-            raise 
+            raise
+
+    def _load_snapshots(self, history_dir: str) -> pd.DataFrame:
+        """Carrega todos os snapshots arquivados em um único DataFrame (uma linha por carta/extração)."""
+        extracted_at: List[str] = []
+        names: List[str] = []
+        quantities: List[Any] = []
+        prices: List[Any] = []
+
+        for filepath in sorted(glob.glob(os.path.join(history_dir, '*.json'))):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data: Dict[str, Any] = json.load(f)
+            for card in data['cards']:
+                extracted_at.append(data['extraction_date'])
+                names.append(card['name'])
+                quantities.append(card['quantity'])
+                prices.append(card['price'])
+
+        return pd.DataFrame({
+            'extraction_date': extracted_at,
+            'name': names,
+            'quantity': quantities,
+            'price': prices,
+        })
+
+    def _read_workbook_dates(self) -> Tuple[Dict[date, int], List[Tuple[Any, ...]]]:
+        """Colunas de data da planilha atual (data -> índice) e suas linhas."""
+        wb = load_workbook(self.excel_file, read_only=True)
+        try:
+            rows: List[Tuple[Any, ...]] = list(wb.active.iter_rows(values_only=True))
+        finally:
+            wb.close()
+        if not rows:
+            return {}, []
+
+        columns: Dict[date, int] = {}
+        for index, header in enumerate(rows[0][2:], start=2):
+            if isinstance(header, datetime):
+                columns[header.date()] = index
+            elif isinstance(header, str):
+                try:
+                    columns[datetime.strptime(header.strip(), self.date_format).date()] = index
+                except ValueError:
+                    continue
+        return columns, rows[1:]
+
+    def _seed_history_from_workbook(self, history_dir: str, known_dates: set) -> int:
+        """Arquiva como snapshots as datas da planilha que não existem no histórico. Retorna quantas foram criadas."""
+        if not os.path.exists(self.excel_file):
+            return 0
+
+        columns, rows = self._read_workbook_dates()
+        missing: Dict[date, int] = {day: index for day, index in columns.items() if day not in known_dates}
+        if not missing:
+            return 0
+
+        os.makedirs(history_dir, exist_ok=True)
+        for day, index in sorted(missing.items()):
+            cards: List[Dict[str, Any]] = [
+                {
+                    'quantity': str(row[1]) if row[1] is not None else '',
+                    'name': row[0],
+                    'price': str(row[index]).replace('.', ',') if isinstance(row[index], float) else str(row[index]),
+                }
+                for row in rows
+                if row[0] is not None and len(row) > index and row[index] is not None
+            ]
+            # Meia-noite: uma extração real do mesmo dia sempre prevalece sobre a semente
+            data: Dict[str, Any] = {
+                'cards': cards,
+                'extraction_date': f"{day:%Y-%m-%d} 00:00:00",
+                'total_cards': len(cards),
+                'seeded_from': self.excel_file,
+            }
+            filepath: str = os.path.join(history_dir, f"cards_{day:%Y%m%d}_000000.json")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+
+        self.logger.warning(
+            f"Seeded {len(missing)} dates from {self.excel_file} into {history_dir} "
+            f"(only the current quantity of each card is known for those dates)"
+        )
+        return len(missing)
+
+    def _backup_workbook(self) -> Optional[str]:
+        """Copia a planilha atual antes de sobrescrevê-la."""
+        if not os.path.exists(self.excel_file):
+            return None
+        root, ext = os.path.splitext(self.excel_file)
+        backup: str = f"{root}.bak{ext}"
+        shutil.copyfile(self.excel_file, backup)
+        self.logger.info(f"Backup of the previous workbook saved in: {backup}")
+        return backup
+
+    def rebuild_excel(self, history_dir: str = HISTORY_DIR) -> str:
+        """Reconstrói a planilha inteira a partir do histórico, em uma única passada e uma única gravação."""
+        try:
+            df: pd.DataFrame = self._load_snapshots(history_dir)
+
+            # Datas que só existem na planilha (extrações anteriores ao histórico) não podem se perder
+            known_dates: set = set(
+                pd.to_datetime(df['extraction_date'], format="%Y-%m-%d %H:%M:%S").dt.date.unique()
+            )
+            if self._seed_history_from_workbook(history_dir, known_dates):
+                df = self._load_snapshots(history_dir)
+            if df.empty:
+                raise ValueError(f"No snapshots found in {history_dir}")
+
+            # Ordena cronologicamente mantendo a ordem das cartas dentro de cada extração
+            df['extraction_date'] = pd.to_datetime(df['extraction_date'], format="%Y-%m-%d %H:%M:%S")
+            df = df.sort_values('extraction_date', kind='stable')
+            df['date'] = df['extraction_date'].dt.normalize()
+            df['price'] = pd.to_numeric(
+                df['price'].astype(str).str.replace(',', '.', regex=False), errors='coerce'
+            )
+
+            # Mesma regra do update_excel: a última extração do dia substitui a coluna inteira
+            # e, dentro dela, a última ocorrência da carta prevalece
+            latest: pd.Series = df.groupby('date')['extraction_date'].transform('max')
+            df = df[df['extraction_date'] == latest]
+            df = df.drop_duplicates(subset=['date', 'name'], keep='last')
+
+            # Matriz cartas x datas, na ordem em que as cartas apareceram pela primeira vez
+            card_order = pd.unique(df['name'])
+            price_matrix: pd.DataFrame = (
+                df.pivot(index='name', columns='date', values='price')
+                .reindex(index=card_order)
+                .sort_index(axis=1)
+            )
+            quantities: pd.Series = df.groupby('name', sort=False)['quantity'].last().reindex(card_order)
+
+            # Cores calculadas de uma vez: compara cada coluna de data com a anterior
+            values: np.ndarray = price_matrix.to_numpy(dtype=float)
+            colors: np.ndarray = np.zeros(values.shape, dtype=np.int8)
+            with np.errstate(invalid='ignore'):
+                colors[:, 1:][values[:, 1:] > values[:, :-1]] = 1
+                colors[:, 1:][values[:, 1:] < values[:, :-1]] = -1
+
+            date_headers: List[str] = [day.strftime(self.date_format) for day in price_matrix.columns]
+            self._backup_workbook()
+            self._write_workbook(card_order, quantities.tolist(), date_headers, values, colors)
+
+            self.logger.info(
+                f"Excel file rebuilt successfully: {self.excel_file} "
+                f"({len(card_order)} cards x {len(date_headers)} dates)"
+            )
+            return self.excel_file
+
+        except Exception as e:
+            self.logger.error(f"Error rebuilding Excel file: {str(e)}")
+            raise
+
+    def _write_workbook(self, names, quantities: List[Any], date_headers: List[str],
+                        values: np.ndarray, colors: np.ndarray) -> None:
+        """Grava a planilha em modo streaming (write-only), já com cores e alinhamento."""
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Sheet1')
+
+        # Estilos registrados uma única vez; cada célula só copia o StyleArray pronto
+        templates: Dict[int, WriteOnlyCell] = {}
+        for color, fill in ((0, None), (1, self.green_fill), (-1, self.red_fill)):
+            template = WriteOnlyCell(ws)
+            template.alignment = self.center_alignment
+            if fill is not None:
+                template.fill = fill
+            templates[color] = template
+
+        def styled(value: Any, color: int = 0) -> Any:
+            if value is None:
+                return None
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(templates[color]._style)
+            return cell
+
+        ws.append(['Nome da Carta', styled('Quantidade')] + [styled(header) for header in date_headers])
+        for name, quantity, row_values, row_colors in zip(names, quantities, values.tolist(), colors.tolist()):
+            ws.append(
+                [name, styled(quantity)]
+                + [
+                    styled(None if value != value else value, color)
+                    for value, color in zip(row_values, row_colors)
+                ]
+            )
+
+        os.makedirs(os.path.dirname(self.excel_file), exist_ok=True)
+        wb.save(self.excel_file)
@@ -0,0 +1,124 @@
+from typing import Any, Callable, Optional
+import logging
+import random
+import threading
+import time
+from src.config.settings import (
+    GOVERNOR_RATE, GOVERNOR_MIN_RATE, GOVERNOR_MAX_RATE, GOVERNOR_BURST,
+    GOVERNOR_SLOW_SECONDS, GOVERNOR_MAX_RETRIES, GOVERNOR_BACKOFF_SECONDS
+)
+
+# Quanto o ritmo sobe (req/s) a cada resposta rápida
+SPEED_UP_STEP: float = 0.1
+# Erros comuns (timeout, elemento ausente) não dizem nada sobre o ritmo: uma nova tentativa basta
+ERROR_RETRIES: int = 1
+
+
+class ThrottledError(Exception):
+    """O site sinalizou excesso de requisições (429/503, página de bloqueio...)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after: Optional[float] = retry_after
+
+
+class RequestGovernor:
+    """Token bucket compartilhado: o ritmo cai pela metade quando o site limita ou demora e sobe aos poucos."""
+
+    def __init__(self, rate: float = GOVERNOR_RATE, min_rate: float = GOVERNOR_MIN_RATE,
+                 max_rate: float = GOVERNOR_MAX_RATE, burst: float = GOVERNOR_BURST,
+                 slow_seconds: float = GOVERNOR_SLOW_SECONDS, max_retries: int = GOVERNOR_MAX_RETRIES,
+                 backoff_seconds: float = GOVERNOR_BACKOFF_SECONDS) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.rate: float = rate
+        self.min_rate: float = min_rate
+        self.max_rate: float = max_rate
+        self.burst: float = burst
+        self.slow_seconds: float = slow_seconds
+        self.max_retries: int = max_retries
+        self.backoff_seconds: float = backoff_seconds
+
+        self._tokens: float = burst
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Bloqueia até haver um token disponível (e nenhuma pausa em andamento)."""
+        while True:
+            with self._lock:
+                now: float = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                wait: float = self._paused_until - now
+                if wait <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if wait <= 0:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _slow_down(self, reason: str, pause: float) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        self.logger.warning(f"{reason}: slowing down to {self.rate:.2f} req/s, pausing {pause:.1f}s")
+
+    def _speed_up(self) -> None:
+        with self._lock:
+            # Aumento aditivo a cada resposta rápida
+            self.rate = min(self.max_rate, self.rate + SPEED_UP_STEP)
+
+    def call(self, func: Callable[[], Any], description: str = "request",
+             check: Optional[Callable[[Any], None]] = None) -> Any:
+        """Executa func no ritmo atual; check lança ThrottledError se houver limitação.
+
+        Só a limitação (com backoff exponencial) e respostas lentas reduzem o ritmo compartilhado;
+        outros erros são repetidos ERROR_RETRIES vezes sem afetar os demais workers.
+        """
+        throttled: int = 0
+        errors: int = 0
+        while True:
+            self.acquire()
+            start: float = time.monotonic()
+            try:
+                result: Any = func()
+                if check is not None:
+                    check(result)
+            except ThrottledError as e:
+                throttled += 1
+                backoff: float = self.backoff_seconds * 2 ** (throttled - 1) * random.uniform(1, 1.5)
+                self._slow_down(f"Throttled on {description}", max(backoff, e.retry_after or 0))
+                if throttled > self.max_retries:
+                    raise
+                self.logger.info(f"Retrying {description} ({throttled}/{self.max_retries})")
+                continue
+            except Exception as e:
+                errors += 1
+                if errors > ERROR_RETRIES:
+                    raise
+                self.logger.warning(f"Error on {description} ({str(e)}), retrying ({errors}/{ERROR_RETRIES})")
+                time.sleep(self.backoff_seconds)
+                continue
+
+            elapsed: float = time.monotonic() - start
+            if elapsed > self.slow_seconds:
+                self._slow_down(f"Slow response on {description} ({elapsed:.1f}s)", 0)
+            else:
+                self._speed_up()
+            return result
+
+
+_governor: Optional[RequestGovernor] = None
+_governor_lock: threading.Lock = threading.Lock()
+
+
+def get_governor() -> RequestGovernor:
+    """Instância única compartilhada por todos os backends de raspagem."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RequestGovernor()
+        return _governor
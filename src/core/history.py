@@ -0,0 +1,218 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import glob
+import json
+import logging
+import os
+import re
+import sqlite3
+from src.config.settings import HISTORY_DIR, HISTORY_DB, QUERY_CACHE_SIZE
+from src.core.targets import DEFAULT_NAME
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    source TEXT PRIMARY KEY,
+    target TEXT NOT NULL,
+    date TEXT NOT NULL,
+    extracted_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_target_date ON snapshots (target, date);
+
+CREATE TABLE IF NOT EXISTS daily_prices (
+    target TEXT NOT NULL,
+    card TEXT NOT NULL,
+    date TEXT NOT NULL,
+    quantity INTEGER,
+    price REAL,
+    PRIMARY KEY (target, date, card)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_daily_prices_target_card ON daily_prices (target, card, date);
+"""
+
+
+def parse_price(value: Any) -> Optional[float]:
+    """Converte o preço do site ("12,50") em float."""
+    try:
+        return float(str(value).replace(',', '.'))
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_quantity(value: Any) -> Optional[int]:
+    """Converte a quantidade do site ("4", "4x") em int."""
+    match = re.search(r'\d+', str(value))
+    return int(match.group()) if match else None
+
+
+def parse_date(value: str) -> str:
+    """Aceita dd/mm/aaaa (formato da planilha) ou aaaa-mm-dd e devolve aaaa-mm-dd."""
+    for date_format in ("%d/%m/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date: {value}")
+
+
+class HistoryStore:
+    """Índice SQLite dos snapshots arquivados, com cache LRU das consultas."""
+
+    def __init__(self, db_path: str = HISTORY_DB, cache_size: int = QUERY_CACHE_SIZE) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.db_path: str = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn: sqlite3.Connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        # Cada instância tem o seu próprio cache, invalidado a cada ingestão
+        self.price_history = lru_cache(maxsize=cache_size)(self._price_history)
+        self.top_movers = lru_cache(maxsize=cache_size)(self._top_movers)
+        self.pool_value = lru_cache(maxsize=cache_size)(self._pool_value)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _clear_cache(self) -> None:
+        self.price_history.cache_clear()
+        self.top_movers.cache_clear()
+        self.pool_value.cache_clear()
+
+    def _iter_history_files(self, history_dir: str) -> Iterator[Tuple[str, str]]:
+        """Lista (alvo, arquivo): a raiz é o alvo padrão e cada subpasta é um alvo nomeado."""
+        for filepath in sorted(glob.glob(os.path.join(history_dir, '*.json'))):
+            yield DEFAULT_NAME, filepath
+        for filepath in sorted(glob.glob(os.path.join(history_dir, '*', '*.json'))):
+            yield os.path.basename(os.path.dirname(filepath)), filepath
+
+    def sync(self, history_dir: str = HISTORY_DIR) -> int:
+        """Indexa os snapshots ainda não ingeridos. Retorna quantos foram adicionados."""
+        known: set = {row[0] for row in self.conn.execute("SELECT source FROM snapshots")}
+        added: int = 0
+        # Uma única transação para todos os snapshots novos
+        with self.conn:
+            for target, filepath in self._iter_history_files(history_dir):
+                source: str = os.path.relpath(filepath, history_dir)
+                if source in known:
+                    continue
+                self._ingest(filepath, target, source)
+                added += 1
+
+        if added:
+            # Atualiza as estatísticas para o planejador escolher o índice certo
+            self.conn.execute("PRAGMA analysis_limit=1000")
+            self.conn.execute("ANALYZE")
+            self._clear_cache()
+            self.logger.info(f"Indexed {added} new snapshots into {self.db_path}")
+        return added
+
+    def ingest_file(self, filepath: str, target: str = DEFAULT_NAME, source: Optional[str] = None) -> None:
+        """Indexa um snapshot; o snapshot mais recente de cada dia substitui os anteriores."""
+        with self.conn:
+            self._ingest(filepath, target, source)
+        self._clear_cache()
+
+    def _ingest(self, filepath: str, target: str, source: Optional[str]) -> None:
+        """Grava o snapshot no índice, sem confirmar a transação."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data: Dict[str, Any] = json.load(f)
+
+        extracted_at: str = data['extraction_date']
+        date: str = datetime.strptime(extracted_at, "%Y-%m-%d %H:%M:%S").strftime("%Y-%m-%d")
+
+        latest: Optional[Tuple[str]] = self.conn.execute(
+            "SELECT MAX(extracted_at) FROM snapshots WHERE target = ? AND date = ?", (target, date)
+        ).fetchone()
+        self.conn.execute(
+            "INSERT INTO snapshots (source, target, date, extracted_at) VALUES (?, ?, ?, ?)",
+            (source or os.path.basename(filepath), target, date, extracted_at),
+        )
+        if latest[0] is not None and latest[0] > extracted_at:
+            return
+
+        self.conn.execute("DELETE FROM daily_prices WHERE target = ? AND date = ?", (target, date))
+        # Mesma regra da planilha: a última ocorrência da carta prevalece
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO daily_prices (target, card, date, quantity, price) VALUES (?, ?, ?, ?, ?)",
+            (
+                (target, card['name'], date, parse_quantity(card['quantity']), parse_price(card['price']))
+                for card in data['cards']
+            ),
+        )
+
+    def _latest_date(self, target: str, until: Optional[str] = None) -> Optional[str]:
+        """Data do último snapshot do alvo (até a data informada, se houver)."""
+        if until is None:
+            row = self.conn.execute("SELECT MAX(date) FROM snapshots WHERE target = ?", (target,)).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT MAX(date) FROM snapshots WHERE target = ? AND date <= ?", (target, until)
+            ).fetchone()
+        return row[0]
+
+    def _first_date(self, target: str, since: str) -> Optional[str]:
+        """Data do primeiro snapshot do alvo a partir da data informada."""
+        row = self.conn.execute(
+            "SELECT MIN(date) FROM snapshots WHERE target = ? AND date >= ?", (target, since)
+        ).fetchone()
+        return row[0]
+
+    def _price_history(self, card: str, target: str = DEFAULT_NAME) -> List[Dict[str, Any]]:
+        """Preço e quantidade da carta em cada data."""
+        rows = self.conn.execute(
+            "SELECT date, quantity, price FROM daily_prices WHERE target = ? AND card = ? ORDER BY date",
+            (target, card),
+        ).fetchall()
+        return [{'date': date, 'quantity': quantity, 'price': price} for date, quantity, price in rows]
+
+    def _top_movers(self, since: str, target: str = DEFAULT_NAME, limit: int = 20) -> Dict[str, Any]:
+        """Cartas com maior variação de preço entre a data informada e o último snapshot."""
+        since = parse_date(since)
+        # Antes do início do histórico, a base é o primeiro snapshot depois da data
+        base_date: Optional[str] = self._latest_date(target, since) or self._first_date(target, since)
+        last_date: Optional[str] = self._latest_date(target)
+        if base_date is None or last_date is None:
+            return {'from': base_date, 'to': last_date, 'movers': []}
+
+        rows = self.conn.execute(
+            """
+            SELECT cur.card, cur.quantity, old.price, cur.price, cur.price - old.price AS delta
+            FROM daily_prices AS cur
+            JOIN daily_prices AS old
+              ON old.target = cur.target AND old.card = cur.card AND old.date = ?
+            WHERE cur.target = ? AND cur.date = ? AND cur.price IS NOT NULL AND old.price IS NOT NULL
+            ORDER BY ABS(cur.price - old.price) DESC
+            LIMIT ?
+            """,
+            (base_date, target, last_date, limit),
+        ).fetchall()
+
+        movers: List[Dict[str, Any]] = [
+            {
+                'card': card,
+                'quantity': quantity,
+                'old_price': old_price,
+                'price': price,
+                'delta': round(delta, 2),
+                'delta_pct': round(delta / old_price * 100, 2) if old_price else None,
+            }
+            for card, quantity, old_price, price, delta in rows
+        ]
+        return {'from': base_date, 'to': last_date, 'movers': movers}
+
+    def _pool_value(self, date: str, target: str = DEFAULT_NAME) -> Dict[str, Any]:
+        """Valor total do pool (preço x quantidade) no último snapshot até a data informada."""
+        snapshot_date: Optional[str] = self._latest_date(target, parse_date(date))
+        if snapshot_date is None:
+            return {'date': None, 'cards': 0, 'value': 0.0}
+
+        cards, value = self.conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(price * COALESCE(quantity, 1)), 0)
+            FROM daily_prices WHERE target = ? AND date = ?
+            """,
+            (target, snapshot_date),
+        ).fetchone()
+        return {'date': snapshot_date, 'cards': cards, 'value': round(value, 2)}
@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional
+import logging
+import queue
+import threading
+from src.config.settings import SCRAPER_WORKERS, SELENIUM_LEAN_PROFILE
+from src.core.scraper import Scraper, RunReport
+from src.core.targets import ScrapeJob
+
+
+class JobQueue:
+    """Fila local de alvos consumida por um pool de workers, cada um com o seu navegador."""
+
+    def __init__(self, jobs: List[ScrapeJob], workers: Optional[int] = None) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.queue: "queue.Queue[ScrapeJob]" = queue.Queue()
+        # Agrupa por conta para que um worker reaproveite a sessão entre alvos da mesma conta
+        for job in sorted(jobs, key=lambda job: job.account):
+            self.queue.put(job)
+        self.workers: int = max(1, min(workers or SCRAPER_WORKERS, len(jobs)))
+        if not SELENIUM_LEAN_PROFILE and self.workers > 1:
+            # O perfil padrão do Chrome fica travado pela primeira instância: só um navegador por vez
+            self.logger.warning("SELENIUM_LEAN_PROFILE=False shares the default Chrome profile; using a single worker")
+            self.workers = 1
+        self.results: Dict[str, RunReport] = {}
+        self.failed: List[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def _worker(self, worker_id: int) -> None:
+        """Consome a fila até esvaziar, reutilizando o mesmo driver para todos os alvos."""
+        scraper: Optional[Scraper] = None
+        try:
+            while True:
+                try:
+                    job: ScrapeJob = self.queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    if scraper is None:
+                        scraper = Scraper(account=job.account, worker_id=worker_id)
+                    report: RunReport = scraper.scrape_target(job)
+                    with self._lock:
+                        self.results[job.name] = report
+                except Exception as e:
+                    self.logger.error(f"Error scraping target {job.name}: {str(e)}")
+                    with self._lock:
+                        self.failed.append(job.name)
+                finally:
+                    self.queue.task_done()
+        finally:
+            if scraper is not None:
+                scraper.close()
+
+    def run(self) -> Dict[str, RunReport]:
+        """Executa todos os alvos e retorna o relatório de cada um."""
+        self.logger.info(f"Running {self.queue.qsize()} targets with {self.workers} workers")
+        threads: List[threading.Thread] = [
+            threading.Thread(target=self._worker, args=(worker_id,), name=f"scraper-{worker_id}")
+            for worker_id in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self.failed:
+            self.logger.warning(f"Targets with errors: {', '.join(self.failed)}")
+        return self.results
@@ -4,8 +4,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException
 import logging
-import time
 from typing import Optional
 
 class Portal:
@@ -28,12 +28,9 @@ class Portal:
             login_button.click()
             self.logger.info("Login modal opened")
             
-            # Wait for the login modal to appear
-            time.sleep(2)  # Small pause to ensure the modal is visible
-            
-            # Fill in the email
+            # Fill in the email as soon as the login modal is visible
             email_field: WebElement = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, '//*[@id="header-lnick"]'))
+                EC.visibility_of_element_located((By.XPATH, '//*[@id="header-lnick"]'))
             )
             email_field.send_keys(email)
             
@@ -48,23 +45,15 @@ class Portal:
             login_link.click()
             self.logger.info("Login link clicked")
             
-            # Wait 5 seconds
-            time.sleep(5)
-            self.logger.info("5-second wait completed")
-            
-            # Check if login was successful
+            # Login succeeded once the login dropdown disappears
             try:
-                # Check if the login element is still present (login failed)
-                login_elements: list[WebElement] = self.driver.find_elements(By.XPATH, '//*[@id="dropdownMenuLogin"]/div')
-                if login_elements:
-                    self.logger.error("Login failed - Invalid credentials or process error")
-                    return False
-                else:
-                    self.logger.info("Login successful!")
-                    return True
-                    
-            except Exception as e:
-                self.logger.error(f"Error checking login status: {str(e)}")
+                self.wait.until(
+                    EC.invisibility_of_element_located((By.XPATH, '//*[@id="dropdownMenuLogin"]/div'))
+                )
+                self.logger.info("Login successful!")
+                return True
+            except TimeoutException:
+                self.logger.error("Login failed - Invalid credentials or process error")
                 return False
                 
         except Exception as e:
@@ -7,15 +7,63 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from typing import List, Optional, Tuple
-import time
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from contextlib import closing
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 import logging
 import os
-import json
-from datetime import datetime
-from src.config.settings import TARGET_URL, SELENIUM_HEADLESS
+import threading
+import time
+from src.config.settings import (
+    SELENIUM_HEADLESS, SELENIUM_LEAN_PROFILE, SELENIUM_PROFILE_DIR, SELENIUM_BLOCKED_URLS, EXTRACT_BATCH_SIZE
+)
 from src.core.portal import Portal
-from dataclasses import dataclass, asdict
+from src.core.session import SessionManager
+from src.core.governor import RequestGovernor, ThrottledError, get_governor
+from src.core.snapshot import SnapshotWriter
+from src.utils.helpers import get_peak_memory_mb
+from src.core.targets import (
+    ScrapeJob, DEFAULT_NAME, load_jobs, get_account_credentials, get_account_cookies_file
+)
+from dataclasses import dataclass
+
+# Títulos de páginas de bloqueio ou limite de requisições (frases inteiras: um deck pode ter "429" no nome)
+THROTTLE_MARKERS: Tuple[str, ...] = (
+    'too many requests', 'error 429', 'access denied', 'acesso negado', 'just a moment'
+)
+
+# Links que levam ao deck: o que envolve a imagem (.picture), o que está dentro dela ou o que a contém
+PICTURE_CLASS: str = "contains(concat(' ', normalize-space(@class), ' '), ' picture ')"
+DECK_LINK_XPATHS: Tuple[str, ...] = (
+    f".//*[{PICTURE_CLASS}]/ancestor::a[@href]",
+    f".//*[{PICTURE_CLASS}]//a[@href]",
+    f".//a[@href][.//*[{PICTURE_CLASS}]]",
+)
+
+# Lê um lote de linhas do deck: [quantidade, nome, preço] ou null se a linha estiver incompleta
+EXTRACT_BATCH_JS: str = """
+const lines = document.querySelectorAll('.pdeck-block .deck-line');
+const end = Math.min(lines.length, arguments[0] + arguments[1]);
+const rows = [];
+for (let i = arguments[0]; i < end; i++) {
+    const parts = ['.deck-qty', '.deck-card', '.deck-price'].map(selector => lines[i].querySelector(selector));
+    rows.push(parts.every(Boolean) ? parts.map(part => part.innerText.trim()) : null);
+}
+return {total: lines.length, rows: rows};
+"""
+
+_driver_path: Optional[str] = None
+_driver_path_lock: threading.Lock = threading.Lock()
+
+
+def get_driver_path() -> str:
+    """Baixa/localiza o chromedriver uma única vez; o webdriver-manager não protege o cache entre threads."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
 
 @dataclass
 class Card:
@@ -23,37 +71,108 @@ class Card:
     name: str
     price: str
 
+@dataclass
+class RunReport:
+    """Resumo da raspagem de um alvo (o pico de memória é do processo inteiro)."""
+    target: str
+    decks: int = 0
+    cards: int = 0
+    elapsed_seconds: float = 0.0
+    peak_memory_mb: Optional[float] = None
+
 class Scraper:
-    def __init__(self) -> None:
+    def __init__(self, account: str = DEFAULT_NAME, worker_id: int = 0) -> None:
         self.logger: logging.Logger = logging.getLogger(__name__)
+        self.worker_id: int = worker_id
+        self.account: str = account
+        self.url: str = ''
+        self._logged_in: bool = False
+        # Verifica a sessão salva enquanto o Chrome inicializa
+        self.session: SessionManager = SessionManager(get_account_cookies_file(account))
+        self._session_check = self.session.check_session_async()
         self.driver: WebDriver = self._setup_driver()
         self.portal: Portal = Portal(self.driver)
+        self.governor: RequestGovernor = get_governor()
         
     def _setup_driver(self) -> WebDriver:
         """Configures and returns a WebDriver instance."""
         chrome_options: Options = Options()
+        # Libera o script assim que o DOM estiver pronto, sem esperar imagens e iframes
+        chrome_options.page_load_strategy = 'eager'
         if SELENIUM_HEADLESS:
-            chrome_options.add_argument('--headless')
-            
-        # Usar o perfil padrão do Chrome
-        user_data_dir: str = os.path.expanduser('~') + '/AppData/Local/Google/Chrome/User Data'
-        chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
-        chrome_options.add_argument('--profile-directory=Default')
-        
+            chrome_options.add_argument('--headless=new')
+
+        if SELENIUM_LEAN_PROFILE:
+            # Perfil dedicado e pequeno, só para a raspagem (um por worker: o Chrome não compartilha perfis)
+            profile_dir: str = SELENIUM_PROFILE_DIR if self.worker_id == 0 else f"{SELENIUM_PROFILE_DIR}-{self.worker_id}"
+            os.makedirs(profile_dir, exist_ok=True)
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+            chrome_options.add_argument('--window-size=1366,768')
+            chrome_options.add_argument('--no-first-run')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--disable-background-networking')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option(
+                'prefs', {'profile.managed_default_content_settings.images': 2}
+            )
+        else:
+            # Usar o perfil padrão do Chrome
+            user_data_dir: str = os.path.expanduser('~') + '/AppData/Local/Google/Chrome/User Data'
+            chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+            chrome_options.add_argument('--profile-directory=Default')
+            chrome_options.add_argument('--start-maximized')
+
         # Configurações básicas para melhor compatibilidade
-        chrome_options.add_argument('--start-maximized')
         chrome_options.add_argument('--disable-notifications')
-        
-        service: Service = Service(ChromeDriverManager().install())
+
+        service: Service = Service(get_driver_path())
         driver: WebDriver = webdriver.Chrome(service=service, options=chrome_options)
-        
+
+        if SELENIUM_LEAN_PROFILE:
+            self._block_resources(driver)
+            self._clear_profile_cookies(driver)
+
         return driver
 
+    def _clear_profile_cookies(self, driver: WebDriver) -> None:
+        """Clears cookies a previous run left in the worker profile (possibly logged in as another account)."""
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception as e:
+            self.logger.warning(f"Error clearing profile cookies: {str(e)}")
+
+    def _block_resources(self, driver: WebDriver) -> None:
+        """Blocks images, CSS, fonts and third-party trackers through the DevTools protocol."""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': SELENIUM_BLOCKED_URLS})
+            self.logger.info(f"Blocking {len(SELENIUM_BLOCKED_URLS)} resource patterns")
+        except Exception as e:
+            self.logger.warning(f"Error enabling resource blocking: {str(e)}")
+
     def _navigate_to_page(self) -> None:
-        """Navigates to the target URL and waits for the page to load."""
-        self.driver.get(TARGET_URL)
+        """Navigates to the target URL and waits for the deck list to load."""
+        def load() -> None:
+            self.driver.get(self.url)
+            self._wait_or_throttled(lambda: self._find_dks_search_div())
+
+        self.governor.call(load, "deck list", check=self._check_throttled)
         self.logger.info("Page loaded successfully")
-        time.sleep(2)  # Wait for initial page load
+
+    def _wait_or_throttled(self, wait: Callable[[], object]) -> object:
+        """Runs an explicit wait; on timeout, reports a throttle page instead of a generic timeout."""
+        try:
+            return wait()
+        except TimeoutException:
+            self._check_throttled()
+            raise
+
+    def _check_throttled(self, _: object = None) -> None:
+        """Raises ThrottledError when the site answered with a block/rate-limit page."""
+        title: str = (self.driver.title or '').lower()
+        if any(marker in title for marker in THROTTLE_MARKERS):
+            raise ThrottledError(f"Throttle page: {self.driver.title}")
 
     def _find_dks_search_div(self) -> WebElement:
         """Finds and returns the dks-search div element."""
@@ -61,207 +180,267 @@ class Scraper:
             EC.presence_of_element_located((By.CLASS_NAME, 'dks-search'))
         )
 
-    def _extract_deck_titles(self, dks_search: WebElement) -> List[str]:
-        """Extracts titles from all deckhome divs within the dks-search div."""
+    def _extract_deck_titles(self, dks_search: WebElement, deck_prefix: str) -> List[str]:
+        """Extracts titles from the deckhome divs whose title starts with deck_prefix."""
         deck_homes: List[WebElement] = dks_search.find_elements(By.CLASS_NAME, 'deckhome')
         deck_titles: List[str] = []
 
         for deck in deck_homes:
             try:
                 title: Optional[str] = deck.get_attribute('title')
-                if title and title.startswith('Pool'):
+                if title and title.startswith(deck_prefix):
                     deck_titles.append(title)
-                    self.logger.info(f"Found Pool deck: {title}")
+                    self.logger.info(f"Found {deck_prefix} deck: {title}")
             except Exception as e:
                 self.logger.warning(f"Error extracting title from deck: {str(e)}")
                 continue
                 
         return deck_titles
 
+    def _find_deck(self, title: str) -> Optional[WebElement]:
+        """Finds the deckhome div with the given title on the deck list page."""
+        dks_search: WebElement = self._find_dks_search_div()
+        for deck in dks_search.find_elements(By.CLASS_NAME, 'deckhome'):
+            if deck.get_attribute('title') == title:
+                return deck
+        return None
+
+    def _find_deck_link(self, deck: WebElement) -> Optional[str]:
+        """Returns the deck page URL from the link tied to the deck picture (never author/edit links)."""
+        for xpath in DECK_LINK_XPATHS:
+            for link in deck.find_elements(By.XPATH, xpath):
+                href: Optional[str] = link.get_attribute('href')
+                if href and href.startswith('http'):
+                    return href
+        return None
+
+    def _js_click_picture(self, deck: WebElement) -> None:
+        """Clicks the deck picture through JavaScript, which works even when CSS is blocked and it has no size."""
+        self.driver.execute_script("arguments[0].click();", deck.find_element(By.CLASS_NAME, 'picture'))
+
     def _click_deck(self, deck: WebElement) -> bool:
-        """Clicks on a specific deck."""
+        """Opens a specific deck."""
         try:
-            # Encontra a div picture dentro do deckhome
-            picture_div: WebElement = deck.find_element(By.CLASS_NAME, 'picture')
-            self.logger.info(f"Clicking on deck: {deck.get_attribute('title')}")
-            picture_div.click()
-            time.sleep(5)  # Espera a página carregar
+            title: Optional[str] = deck.get_attribute('title')
+            # Abre pelo link do deck: não depende do layout (CSS e imagens podem estar bloqueados)
+            href: Optional[str] = self._find_deck_link(deck)
+            self.logger.info(f"Opening deck: {title}")
+
+            def wait_deck_page() -> None:
+                # Espera a lista de cartas em vez de uma pausa fixa
+                self._wait_or_throttled(lambda: WebDriverWait(self.driver, 20).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, 'pdeck-block'))
+                ))
+
+            def open_deck() -> None:
+                nonlocal deck, href
+                if href:
+                    try:
+                        self.driver.get(href)
+                        wait_deck_page()
+                        return
+                    except ThrottledError:
+                        raise
+                    except Exception as e:
+                        # Link errado ou que não abre o deck: passa a usar o clique na imagem
+                        self.logger.warning(f"Deck link {href} did not open the deck ({str(e)}); using a JavaScript click")
+                        href = None
+                try:
+                    self._js_click_picture(deck)
+                except StaleElementReferenceException:
+                    # Uma tentativa anterior mudou a página: recarrega a lista e localiza o deck de novo
+                    self.driver.get(self.url)
+                    deck = self._find_deck(title)
+                    if deck is None:
+                        raise
+                    self._js_click_picture(deck)
+                wait_deck_page()
+
+            self.governor.call(open_deck, f"deck {title}", check=self._check_throttled)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error clicking on deck: {str(e)}")
+            self.logger.error(f"Error opening deck: {str(e)}")
             return False
 
     def _go_back(self) -> bool:
         """Volta uma página no navegador."""
         try:
-            self.driver.back()
-            time.sleep(3)  # Espera a página carregar
+            self.governor.call(self.driver.back, "go back")
+            self._find_dks_search_div()
             return True
         except Exception as e:
             self.logger.error(f"Error going back: {str(e)}")
             return False
 
+    def _get_credentials(self) -> Tuple[Optional[str], Optional[str]]:
+        """Returns the LigaMagic credentials configured for the current account."""
+        return get_account_credentials(self.account)
+
     def login(self) -> bool:
-        """Performs login on the platform."""
+        """Ensures an authenticated session, reusing saved cookies when still valid."""
         email: Optional[str]
         password: Optional[str]
         email, password = self._get_credentials()
-        if not email or not password:
-            return False
-            
-        return self.portal.login(email, password)
+        self._logged_in = self.session.ensure_session(self.driver, self.portal, email, password, self._session_check)
+        self._session_check = None
+        return self._logged_in
+
+    def use_account(self, account: str) -> None:
+        """Switches the browser to another account, keeping the same driver."""
+        if account == self.account:
+            return
+        self.logger.info(f"Switching account: {self.account} -> {account}")
+        self.driver.delete_all_cookies()
+        self.account = account
+        self.session = SessionManager(get_account_cookies_file(account))
+        self._session_check = None
+        self._logged_in = False
         
-    def _extract_cards(self) -> List[Card]:
-        """Extrai as informações das cartas do deck."""
+    def _extract_cards(self) -> Iterator[Card]:
+        """Extrai as cartas do deck em lotes, sem manter todas as linhas da página em memória.
+
+        Falhas são propagadas: um deck lido pela metade faria o snapshot publicar cartas como removidas.
+        """
         try:
             # Encontra o bloco principal do deck
-            pdeck_block: WebElement = WebDriverWait(self.driver, 10).until(
+            WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, 'pdeck-block'))
             )
-            
-            # Encontra todas as linhas do deck
-            deck_lines: List[WebElement] = pdeck_block.find_elements(By.CLASS_NAME, 'deck-line')
-            cards: List[Card] = []
-            
-            for line in deck_lines:
-                try:
-                    # Verifica se a linha tem todos os elementos necessários
-                    qty: WebElement = line.find_element(By.CLASS_NAME, 'deck-qty')
-                    card: WebElement = line.find_element(By.CLASS_NAME, 'deck-card')
-                    price: WebElement = line.find_element(By.CLASS_NAME, 'deck-price')
-                    
-                    # Cria um objeto Card com as informações
-                    card_obj: Card = Card(
-                        quantity=qty.text.strip(),
-                        name=card.text.strip(),
-                        price=price.text.strip()
-                    )
-                    
-                    cards.append(card_obj)
-                    self.logger.info(f"Card found: {card_obj.quantity}x {card_obj.name} - {card_obj.price}")
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error extracting card information: {str(e)}")
-                    continue
-            print(cards)
-            return cards
-            
         except Exception as e:
             self.logger.error(f"Error extracting cards: {str(e)}")
-            return []
+            raise
+
+        start: int = 0
+        while True:
+            try:
+                # Lê um lote de linhas direto no navegador (uma chamada por lote, não três por carta)
+                batch: dict = self.driver.execute_script(EXTRACT_BATCH_JS, start, EXTRACT_BATCH_SIZE)
+            except Exception as e:
+                self.logger.error(f"Error extracting cards: {str(e)}")
+                raise
+
+            for row in batch['rows']:
+                if row is None:
+                    self.logger.warning("Error extracting card information: incomplete deck line")
+                    continue
+                card: Card = Card(quantity=row[0], name=row[1], price=row[2])
+                self.logger.debug(f"Card found: {card.quantity}x {card.name} - {card.price}")
+                yield card
+
+            start += len(batch['rows'])
+            if not batch['rows'] or start >= batch['total']:
+                return
 
-    def _extract_cards_from_deck(self, deck: WebElement) -> List[Card]:
+    def _extract_cards_from_deck(self, deck: WebElement) -> Iterator[Card]:
         """Extrai as cartas de um deck específico."""
         try:
-            # Clica no deck
+            # Abre o deck; mesmo se falhar, o navegador pode ter saído da lista
             if not self._click_deck(deck):
-                self.logger.error("Could not click on deck")
-                return []
-            
+                raise ValueError("Could not open deck")
+
             # Extrai as cartas
-            cards: List[Card] = self._extract_cards()
-            
+            yield from self._extract_cards()
+        finally:
             # Volta para a página inicial
             self._navigate_to_page()
-            time.sleep(5)  # Espera a página carregar
-            
-            return cards
-            
-        except Exception as e:
-            self.logger.error(f"Error extracting cards from deck: {str(e)}")
-            return []
 
-    def save_cards_to_json(self, cards: List[Card], filename: str = "cards.json") -> None:
-        """Salva os cards em um arquivo JSON com a data da extração."""
+    def save_cards_to_json(self, cards: Iterable[Card], filename: str = "cards.json",
+                           history_dir: Optional[str] = None) -> int:
+        """Salva os cards em um arquivo JSON com a data da extração, à medida que chegam."""
         try:
-            # Cria o diretório de saída se não existir
-            output_dir: str = "output"
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Cria o caminho completo do arquivo
-            filepath: str = os.path.join(output_dir, filename)
-            
-            # Prepara os dados para salvar
-            data: dict = {
-                "extraction_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "total_cards": len(cards),
-                "cards": [asdict(card) for card in cards]
-            }
-            
-            # Salva os dados em JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            
-            self.logger.info(f"Cards saved successfully in: {filepath}")
-            
+            history_dir = history_dir or ScrapeJob(name=DEFAULT_NAME, url='').history_dir
+            with SnapshotWriter(os.path.join("output", filename), history_dir) as writer:
+                for card in cards:
+                    writer.write(card)
+            return writer.total
+
         except Exception as e:
             self.logger.error(f"Error saving cards to JSON: {str(e)}")
             raise
 
-    def scrape_data(self) -> List[Card]:
+    def _iter_target_cards(self, job: ScrapeJob, report: "RunReport") -> Iterator[Card]:
+        """Percorre os decks do alvo gerando as cartas uma a uma."""
+        # Find the dks-search div and get the tracked decks
+        dks_search: WebElement = self._find_dks_search_div()
+        deck_titles: List[str] = self._extract_deck_titles(dks_search, job.deck_prefix)
+
+        self.logger.info(f"Total {job.deck_prefix} decks found: {len(deck_titles)}")
+
+        # Percorre todos os decks pelos títulos
+        for i, title in enumerate(deck_titles, 1):
+            try:
+                self.logger.info(f"Processing deck {i} of {len(deck_titles)}: {title}")
+
+                # Encontra o deck atual pelo título
+                current_deck: Optional[WebElement] = self._find_deck(title)
+
+                if current_deck is None:
+                    raise ValueError(f"Deck not found on the list: {title}")
+
+                # Extrai as cartas do deck atual; closing garante a volta à lista mesmo se o consumidor falhar
+                deck_cards: int = 0
+                with closing(self._extract_cards_from_deck(current_deck)) as cards:
+                    for card in cards:
+                        deck_cards += 1
+                        yield card
+                report.decks += 1
+                self.logger.info(f"Total cards found in this deck: {deck_cards}")
+
+            except Exception as e:
+                # Um deck faltando (ou pela metade) apareceria no snapshot como cartas removidas
+                self.logger.error(f"Error processing deck {i}: {str(e)}")
+                raise
+
+        # Sem nenhum deck lido, o snapshot vazio apareceria como "todas as cartas removidas"
+        if not report.decks:
+            raise ValueError(f"No {job.deck_prefix} deck processed for target {job.name}; snapshot discarded")
+
+    def scrape_target(self, job: ScrapeJob) -> "RunReport":
+        """Scrapes one target, keeping the driver open so it can be reused by the next job."""
+        self.logger.info(f"Starting LigaMagic data scraping for target: {job.name}")
+        report: RunReport = RunReport(target=job.name)
+        start: float = time.monotonic()
+
+        # Garante a sessão antes de raspar (sem login completo se os cookies ainda valem)
+        self.use_account(job.account)
+        if not self._logged_in and not self.login():
+            self.logger.warning("Session not confirmed, continuing with the current browser session")
+
+        # Navigate to the page
+        self.url = job.url
+        self._navigate_to_page()
+
+        # As cartas vão direto para o JSON do alvo, sem acumular a lista em memória
+        with closing(self._iter_target_cards(job, report)) as cards:
+            report.cards = self.save_cards_to_json(cards, job.json_filename, job.history_dir)
+
+        report.elapsed_seconds = round(time.monotonic() - start, 1)
+        report.peak_memory_mb = get_peak_memory_mb()
+        self.logger.info(
+            f"Total cards found in all decks of {job.name}: {report.cards} "
+            f"({report.decks} decks, {report.elapsed_seconds}s, peak memory {report.peak_memory_mb} MB)"
+        )
+        return report
+
+    def scrape_data(self, job: Optional[ScrapeJob] = None) -> "RunReport":
         """Performs data scraping from the LigaMagic website."""
-        self.logger.info("Starting LigaMagic data scraping...")
-        all_cards: List[Card] = []
-        
         try:
-            # Navigate to the page
-            self._navigate_to_page()
-            time.sleep(5)  # Wait for the page to load
-            
-            # Find the dks-search div and get all Pool decks
-            dks_search: WebElement = self._find_dks_search_div()
-            deck_homes: List[WebElement] = dks_search.find_elements(By.CLASS_NAME, 'deckhome')
-            
-            # Armazena os títulos dos decks Pool
-            pool_deck_titles: List[str] = []
-            for deck in deck_homes:
-                title: Optional[str] = deck.get_attribute('title')
-                if title and title.startswith('Pool'):
-                    pool_deck_titles.append(title)
-            
-            self.logger.info(f"Total Pool decks found: {len(pool_deck_titles)}")
-            
-            # Percorre todos os decks Pool pelos títulos
-            for i, title in enumerate(pool_deck_titles, 1):
-                try:
-                    self.logger.info(f"Processing deck {i} of {len(pool_deck_titles)}: {title}")
-                    
-                    # Encontra o deck atual pelo título
-                    dks_search = self._find_dks_search_div()
-                    deck_homes = dks_search.find_elements(By.CLASS_NAME, 'deckhome')
-                    current_deck: Optional[WebElement] = None
-                    
-                    for deck in deck_homes:
-                        if deck.get_attribute('title') == title:
-                            current_deck = deck
-                            break
-                    
-                    if current_deck:
-                        # Extrai as cartas do deck atual
-                        cards: List[Card] = self._extract_cards_from_deck(current_deck)
-                        all_cards.extend(cards)
-                        self.logger.info(f"Total cards found in this deck: {len(cards)}")
-                        
-                except Exception as e:
-                    self.logger.error(f"Error processing deck {i}: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Total cards found in all decks: {len(all_cards)}")
-            
-            # Salva os cards em JSON
-            self.save_cards_to_json(all_cards)
-            
-            return all_cards
-            
+            return self.scrape_target(job or load_jobs()[0])
+
         except Exception as e:
             self.logger.error(f"Error during scraping: {str(e)}")
             raise
-            
+
         finally:
+            self.close()
+
+    def close(self) -> None:
+        """Closes the browser."""
+        if getattr(self, 'driver', None) is not None:
             self.driver.quit()
-            
+            self.driver = None
+
     def __del__(self) -> None:
         """Ensures the driver is closed when the instance is destroyed."""
-        if hasattr(self, 'driver'):
-            self.driver.quit() 
\ No newline at end of file
+        self.close() 
\ No newline at end of file
@@ -0,0 +1,180 @@
+from selenium.webdriver.chrome.webdriver import WebDriver
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+import requests
+import logging
+import json
+import os
+import time
+import threading
+from src.config.settings import BASE_URL, COOKIES_FILE
+from src.core.portal import Portal
+from src.core.governor import ThrottledError, get_governor
+
+# Elemento que só aparece para visitantes não autenticados
+LOGIN_MARKER: str = 'id="dropdownMenuLogin"'
+
+# Um lock por arquivo de cookies: workers da mesma conta não fazem login ao mesmo tempo
+_login_locks: Dict[str, threading.Lock] = {}
+_login_locks_guard: threading.Lock = threading.Lock()
+
+
+def _get_login_lock(cookies_file: str) -> threading.Lock:
+    with _login_locks_guard:
+        return _login_locks.setdefault(os.path.abspath(cookies_file), threading.Lock())
+
+
+def check_response(response: requests.Response) -> None:
+    """Lança ThrottledError quando o site responde 429/503, respeitando o Retry-After."""
+    if response.status_code in (429, 503):
+        retry_after: str = response.headers.get('Retry-After', '')
+        raise ThrottledError(
+            f"HTTP {response.status_code}", float(retry_after) if retry_after.isdigit() else None
+        )
+
+
+class SessionManager:
+    """Persiste os cookies da sessão e só refaz o login no portal quando ela expira."""
+
+    def __init__(self, cookies_file: str = COOKIES_FILE) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.cookies_file: str = cookies_file
+        self._checked_cookies: Optional[List[dict]] = None
+
+    def _read_file(self) -> Dict[str, Any]:
+        """Lê o arquivo de sessão ({user_agent, cookies}); aceita também a lista de cookies antiga."""
+        if not os.path.exists(self.cookies_file):
+            return {}
+        try:
+            with open(self.cookies_file, 'r', encoding='utf-8') as f:
+                data: Any = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Error reading cookies file: {str(e)}")
+            return {}
+        return {'cookies': data} if isinstance(data, list) else data
+
+    def read_cookies(self) -> List[dict]:
+        """Lê os cookies salvos, descartando os que já expiraram."""
+        cookies: List[dict] = self._read_file().get('cookies', [])
+        now: float = time.time()
+        return [cookie for cookie in cookies if cookie.get('expiry', now + 1) > now]
+
+    def read_user_agent(self) -> Optional[str]:
+        """User-Agent do navegador que obteve os cookies salvos."""
+        return self._read_file().get('user_agent')
+
+    def get_user_agent(self, driver: WebDriver) -> Optional[str]:
+        """User-Agent do navegador em uso."""
+        try:
+            return driver.execute_script('return navigator.userAgent')
+        except Exception as e:
+            self.logger.warning(f"Error reading browser user agent: {str(e)}")
+            return None
+
+    def save_cookies(self, driver: WebDriver) -> None:
+        """Salva os cookies atuais do navegador, junto com o User-Agent usado para obtê-los."""
+        try:
+            os.makedirs(os.path.dirname(self.cookies_file) or '.', exist_ok=True)
+            data: Dict[str, Any] = {'user_agent': self.get_user_agent(driver), 'cookies': driver.get_cookies()}
+            with open(self.cookies_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=4)
+            self.logger.info(f"Session cookies saved in: {self.cookies_file}")
+        except Exception as e:
+            self.logger.warning(f"Error saving cookies: {str(e)}")
+
+    def load_cookies(self, driver: WebDriver, cookies: List[dict]) -> None:
+        """Injeta os cookies no navegador (exige estar no domínio do portal)."""
+        get_governor().call(lambda: driver.get(BASE_URL), "load cookies")
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                self.logger.debug(f"Skipping cookie {cookie.get('name')}: {str(e)}")
+
+    def is_session_valid(self, cookies: List[dict], user_agent: Optional[str]) -> Optional[bool]:
+        """Verifica a sessão com uma única requisição HTTP, sem abrir o navegador.
+
+        Retorna None quando a resposta não permite concluir (403, página de desafio, erro de rede...).
+        """
+        if not cookies:
+            return False
+        try:
+            jar = requests.cookies.RequestsCookieJar()
+            for cookie in cookies:
+                jar.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+            # Sem o User-Agent do navegador, sites que filtram robôs respondem 403 ou um desafio
+            headers: Dict[str, str] = {'User-Agent': user_agent} if user_agent else {}
+            response = get_governor().call(
+                lambda: requests.get(BASE_URL, cookies=jar, headers=headers, timeout=10),
+                "session check", check=check_response
+            )
+        except Exception as e:
+            self.logger.warning(f"Error checking session: {str(e)}")
+            return None
+
+        if LOGIN_MARKER in response.text:
+            self.logger.info("Saved session is stale")
+            return False
+        if not response.ok:
+            self.logger.info(f"Session check inconclusive (HTTP {response.status_code})")
+            return None
+        self.logger.info("Saved session is valid")
+        return True
+
+    def _is_browser_session_valid(self, driver: WebDriver) -> bool:
+        """Confere a sessão no próprio navegador, depois de injetar os cookies."""
+        get_governor().call(lambda: driver.get(BASE_URL), "session check")
+        valid: bool = LOGIN_MARKER not in driver.page_source
+        self.logger.info(f"Saved session is {'valid' if valid else 'stale'} (checked in the browser)")
+        return valid
+
+    def check_session_async(self) -> Future:
+        """Dispara a verificação da sessão salva em segundo plano (em paralelo à subida do Chrome)."""
+        self._checked_cookies = self.read_cookies()
+        user_agent: Optional[str] = self.read_user_agent()
+        if user_agent is None:
+            # Cookies salvos sem User-Agent: a verificação espera o navegador subir
+            future: Future = Future()
+            future.set_result(None)
+            return future
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.is_session_valid, self._checked_cookies, user_agent)
+        executor.shutdown(wait=False)
+        return future
+
+    def ensure_session(self, driver: WebDriver, portal: Portal, email: Optional[str],
+                       password: Optional[str], session_check: Optional[Future] = None) -> bool:
+        """Reaproveita a sessão salva; faz o login completo apenas se ela estiver expirada."""
+        with _get_login_lock(self.cookies_file):
+            # Outro worker pode ter renovado os cookies depois da verificação assíncrona
+            cookies: List[dict] = self.read_cookies()
+            valid: Optional[bool] = None
+            if session_check is not None and cookies == self._checked_cookies:
+                valid = session_check.result()
+            if valid is None:
+                valid = self.is_session_valid(cookies, self.get_user_agent(driver))
+
+            loaded: bool = False
+            if valid is None:
+                # Resposta inconclusiva: injeta os cookies e confere no navegador antes de refazer o login
+                self.load_cookies(driver, cookies)
+                loaded = True
+                valid = self._is_browser_session_valid(driver)
+
+            if valid:
+                if not loaded:
+                    self.load_cookies(driver, cookies)
+                self.logger.info("Reusing saved session")
+                return True
+
+            if not email or not password:
+                self.logger.warning("No credentials configured; relying on the browser profile session")
+                return False
+
+            get_governor().call(lambda: driver.get(BASE_URL), "login page")
+            if not portal.login(email, password):
+                return False
+
+            self.save_cookies(driver)
+            return True
@@ -0,0 +1,67 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Optional
+import json
+import logging
+import os
+import shutil
+from src.config.settings import SNAPSHOT_FLUSH_EVERY
+
+
+class SnapshotWriter:
+    """Grava o snapshot em JSON de forma incremental, sem manter as cartas em memória."""
+
+    def __init__(self, filepath: str, history_dir: str, flush_every: int = SNAPSHOT_FLUSH_EVERY) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.filepath: str = filepath
+        self.history_dir: str = history_dir
+        self.flush_every: int = flush_every
+        self.total: int = 0
+
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        self._tmp_path: str = f"{filepath}.tmp"
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('{\n    "cards": [')
+
+    def write(self, card: Any) -> None:
+        """Acrescenta uma carta (dataclass) ao arquivo."""
+        separator: str = ',' if self.total else ''
+        self._file.write(f"{separator}\n        {json.dumps(asdict(card), ensure_ascii=False)}")
+        self.total += 1
+        if self.total % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self) -> str:
+        """Fecha o JSON, publica o arquivo e arquiva uma cópia no histórico. Retorna o snapshot arquivado."""
+        extraction_date: datetime = datetime.now()
+        self._file.write(
+            f'\n    ],\n    "extraction_date": "{extraction_date:%Y-%m-%d %H:%M:%S}",'
+            f'\n    "total_cards": {self.total}\n}}\n'
+        )
+        self._file.close()
+        os.replace(self._tmp_path, self.filepath)
+        self.logger.info(f"Cards saved successfully in: {self.filepath}")
+
+        # Arquiva uma cópia no histórico para permitir reconstruir a planilha
+        os.makedirs(self.history_dir, exist_ok=True)
+        snapshot_path: str = os.path.join(self.history_dir, f"cards_{extraction_date:%Y%m%d_%H%M%S}.json")
+        # Cópia atômica: a API sincroniza o histórico enquanto roda e não pode ler um arquivo pela metade
+        shutil.copyfile(self.filepath, f"{snapshot_path}.tmp")
+        os.replace(f"{snapshot_path}.tmp", snapshot_path)
+        self.logger.info(f"Snapshot archived in: {snapshot_path}")
+        return snapshot_path
+
+    def abort(self) -> None:
+        """Descarta o arquivo parcial."""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import os
+from src.config.settings import (
+    TARGET_URL, TARGETS_FILE, HISTORY_DIR, COOKIES_FILE, LIGAMAGIC_EMAIL, LIGAMAGIC_PASSWORD
+)
+
+DEFAULT_NAME: str = 'default'
+
+
+@dataclass
+class ScrapeJob:
+    """Um alvo de raspagem: página de decks, conta usada e prefixo dos decks acompanhados."""
+    name: str
+    url: str
+    account: str = DEFAULT_NAME
+    deck_prefix: str = 'Pool'
+
+    def _suffix(self) -> str:
+        # O alvo padrão mantém os nomes de arquivo originais
+        return '' if self.name == DEFAULT_NAME else f"_{self.name}"
+
+    @property
+    def json_filename(self) -> str:
+        return f"cards{self._suffix()}.json"
+
+    @property
+    def excel_file(self) -> str:
+        return os.path.join('output', f"pool{self._suffix()}.xlsx")
+
+    @property
+    def diff_json(self) -> str:
+        return os.path.join('output', f"diff{self._suffix()}.json")
+
+    @property
+    def diff_excel(self) -> str:
+        return os.path.join('output', f"diff{self._suffix()}.xlsx")
+
+    @property
+    def history_dir(self) -> str:
+        return HISTORY_DIR if self.name == DEFAULT_NAME else os.path.join(HISTORY_DIR, self.name)
+
+
+def get_account_credentials(account: str) -> Tuple[Optional[str], Optional[str]]:
+    """Retorna e-mail e senha da conta (LIGAMAGIC_EMAIL ou LIGAMAGIC_<CONTA>_EMAIL)."""
+    if account == DEFAULT_NAME:
+        return LIGAMAGIC_EMAIL or None, LIGAMAGIC_PASSWORD or None
+    prefix: str = f"LIGAMAGIC_{account.upper()}"
+    return os.getenv(f"{prefix}_EMAIL") or None, os.getenv(f"{prefix}_PASSWORD") or None
+
+
+def get_account_cookies_file(account: str) -> str:
+    """Arquivo de cookies da conta; contas diferentes nunca compartilham sessão."""
+    if account == DEFAULT_NAME:
+        return COOKIES_FILE
+    root, ext = os.path.splitext(COOKIES_FILE)
+    return f"{root}_{account}{ext}"
+
+
+def load_jobs(targets_file: str = TARGETS_FILE) -> List[ScrapeJob]:
+    """Lê os alvos do arquivo JSON; sem arquivo, usa apenas o TARGET_URL do .env."""
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    if not os.path.exists(targets_file):
+        return [ScrapeJob(name=DEFAULT_NAME, url=TARGET_URL)]
+
+    with open(targets_file, 'r', encoding='utf-8') as f:
+        entries: List[Dict[str, Any]] = json.load(f)
+
+    jobs: List[ScrapeJob] = [ScrapeJob(**entry) for entry in entries]
+    logger.info(f"Loaded {len(jobs)} targets from {targets_file}")
+    return jobs
+
+
+def find_job(name: str, targets_file: str = TARGETS_FILE) -> ScrapeJob:
+    """Retorna o alvo com o nome informado."""
+    for job in load_jobs(targets_file):
+        if job.name == name:
+            return job
+    raise ValueError(f"Target {name} not found in {targets_file}")
@@ -0,0 +1,139 @@
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+BASE_DIR: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Custo de importação de cada subcomando, medido em um processo novo
+IMPORT_PROBES: Dict[str, str] = {
+    'python': 'pass',
+    'cli': 'import src.cli',
+    'status': 'import src.cli, src.core.targets',
+    'query': 'import src.cli, src.core.history',
+    'update/rebuild': 'import src.cli, src.core.excel_handler',
+    'scrape': 'import src.cli, src.core.jobs',
+}
+
+
+def _time_subprocess(args: List[str], repeat: int = 3) -> Optional[float]:
+    """Melhor tempo (ms) de um processo Python novo, ou None se ele falhar."""
+    env: Dict[str, str] = dict(os.environ, PYTHONPATH=BASE_DIR)
+    best: Optional[float] = None
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        result = subprocess.run(args, cwd=BASE_DIR, env=env, capture_output=True)
+        elapsed: float = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            return None
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _time_call(func: Callable[[], object]) -> float:
+    """Tempo (ms) de uma chamada."""
+    start: float = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+@dataclass
+class _BenchCard:
+    quantity: str
+    name: str
+    price: str
+
+
+def _snapshot_peak_kb(directory: str, cards: int) -> float:
+    """Pico de memória (KB) ao gravar um snapshot de N cartas vindas de um gerador."""
+    from src.core.snapshot import SnapshotWriter
+
+    tracemalloc.start()
+    with SnapshotWriter(os.path.join(directory, f"cards_{cards}.json"), os.path.join(directory, f"history_{cards}")) as writer:
+        for i in range(cards):
+            writer.write(_BenchCard(quantity="1", name=f"Card {i}", price="1,00"))
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def _write_synthetic_history(history_dir: str, cards: int, days: int) -> None:
+    """Gera snapshots diários sintéticos no formato do cards.json."""
+    rng: random.Random = random.Random(42)
+    names: List[str] = [f"Card {i}" for i in range(cards)]
+    prices: List[float] = [rng.uniform(0.5, 100) for _ in names]
+    start: datetime = datetime(2020, 1, 1, 10)
+
+    os.makedirs(history_dir, exist_ok=True)
+    for day in range(days):
+        extraction_date: datetime = start + timedelta(days=day)
+        prices = [max(0.1, price * rng.uniform(0.95, 1.05)) for price in prices]
+        data: dict = {
+            "extraction_date": extraction_date.strftime("%Y-%m-%d %H:%M:%S"),
+            "total_cards": cards,
+            "cards": [
+                {"quantity": str(rng.randint(1, 4)), "name": name, "price": f"{price:.2f}".replace('.', ',')}
+                for name, price in zip(names, prices)
+            ],
+        }
+        filepath: str = os.path.join(history_dir, f"cards_{extraction_date:%Y%m%d_%H%M%S}.json")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+
+def _unit(name: str) -> str:
+    return 'KB' if '.peak_kb.' in name else 'ms'
+
+
+def run_benchmarks(cards: int, days: int, output: Optional[str] = None) -> Dict[str, Optional[float]]:
+    """Executa os benchmarks e imprime os tempos (ms) e picos de memória (KB)."""
+    results: Dict[str, Optional[float]] = {}
+
+    # Inicialização: importações de cada subcomando e o 'status' completo
+    for name, code in IMPORT_PROBES.items():
+        results[f"startup.import.{name}"] = _time_subprocess([sys.executable, '-c', code])
+    results["startup.run.status"] = _time_subprocess([sys.executable, os.path.join(BASE_DIR, 'run.py'), 'status'])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history_dir: str = os.path.join(tmp, 'history')
+        _write_synthetic_history(history_dir, cards, days)
+
+        # Consultas sobre o índice do histórico
+        from src.core.history import HistoryStore
+        store: HistoryStore = HistoryStore(os.path.join(tmp, 'history.db'))
+        results["history.sync"] = _time_call(lambda: store.sync(history_dir))
+        since: str = (datetime(2020, 1, 1) + timedelta(days=days // 2)).strftime("%d/%m/%Y")
+        for label in ('cold', 'cached'):
+            results[f"query.price.{label}"] = _time_call(lambda: store.price_history("Card 1"))
+            results[f"query.movers.{label}"] = _time_call(lambda: store.top_movers(since))
+            results[f"query.value.{label}"] = _time_call(lambda: store.pool_value(since))
+        store.close()
+
+        # Gravação em streaming: o pico de memória não deve crescer com o número de cartas
+        for size in (200, 20000):
+            results[f"snapshot.peak_kb.{size}"] = _snapshot_peak_kb(tmp, size)
+
+        # Reconstrução completa da planilha
+        try:
+            from src.core.excel_handler import ExcelHandler
+            handler: ExcelHandler = ExcelHandler(os.path.join(tmp, 'pool.xlsx'))
+            results["excel.rebuild"] = _time_call(lambda: handler.rebuild_excel(history_dir))
+        except ImportError:
+            results["excel.rebuild"] = None
+
+    lines: List[str] = [f"Benchmark: {cards} cards x {days} snapshots"] + [
+        f"{name:<32} {'n/a' if value is None else f'{value:10.2f} {_unit(name)}'}" for name, value in results.items()
+    ]
+    print("\n".join(lines))
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    return results
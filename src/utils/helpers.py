@@ -1,4 +1,5 @@
 import os
+import sys
 import logging
 from src.config.settings import LOG_FILE, LOG_FORMAT, LOG_LEVEL
 
@@ -40,4 +41,41 @@ def validate_environment():
     if missing_vars:
         raise EnvironmentError(
             f"Variáveis de ambiente ausentes: {', '.join(missing_vars)}"
-        ) 
\ No newline at end of file
+        ) 
+
+def get_peak_memory_mb():
+    """Retorna o pico de memória (RSS) do processo em MB, ou None se não for possível medir."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux informa em KB; macOS em bytes
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    except ImportError:
+        pass
+
+    # Windows: PeakWorkingSetSize via psapi
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+        return round(counters.PeakWorkingSetSize / (1024 * 1024), 1)
+    except Exception:
+        return None